@@ -78,7 +78,7 @@ float gpuUsageBase = 35.0;
 float fpsBase = 120.0;
 
 void setup() {
-  Serial.begin(9600);
+  Serial.begin(115200);
   
   // Initialize TFT display
   tft.begin();
@@ -4,11 +4,190 @@ import psutil
 import subprocess
 import sys
 import os
-from datetime import datetime
+import re
+import ctypes
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 import json
 
+try:
+    import pynvml
+except ImportError:
+    pynvml = None
+
+try:
+    import pythoncom
+except ImportError:
+    pythoncom = None
+
+try:
+    import win32com.client
+except ImportError:
+    win32com = None
+
+# WMI namespaces used for sensor readings on Windows
+OHM_NAMESPACE = "root\\OpenHardwareMonitor"
+LHM_NAMESPACE = "root\\LibreHardwareMonitor"
+THERMAL_NAMESPACE = "root\\wmi"
+
+# WQL queries fetching only the properties we read, in one marshaled batch
+SENSOR_QUERY = "SELECT Name, SensorType, Value FROM Sensor"
+THERMAL_QUERY = "SELECT CurrentTemperature FROM MSAcpi_ThermalZoneTemperature"
+WBEM_FLAGS = 0x10 | 0x20  # wbemFlagReturnImmediately | wbemFlagForwardOnly
+
+# Serial frame for Arduino: CPU_Temp,GPU_Temp,CPU_Usage,RAM_Usage,GPU_Usage,FPS
+FRAME_FMT = b"%d,%d,%d,%d,%d,%d\n"
+
+# Keywords of interest in sensor names, matched in one scan per name
+SENSOR_NAME_RE = re.compile(r'cpu|gpu|fps|framerate', re.IGNORECASE)
+CPU_SENSOR_NAME_RE = re.compile(r'cpu|core|processor', re.IGNORECASE)
+
+# Sensor dispatch table: reading -> predicate(sensor_type, lowercase keywords in name)
+SENSOR_PREDICATES = {
+    'cpu_temp': lambda sensor_type, keywords: sensor_type == 'Temperature' and 'cpu' in keywords,
+    'gpu_temp': lambda sensor_type, keywords: sensor_type == 'Temperature' and 'gpu' in keywords,
+    'gpu_usage': lambda sensor_type, keywords: sensor_type == 'Load' and 'gpu' in keywords,
+    'fps': lambda sensor_type, keywords: 'fps' in keywords or 'framerate' in keywords,
+}
+
+def clamp(value, low, high):
+    """Limit value to [low, high] with plain comparisons (no min/max calls)"""
+    return low if value < low else high if value > high else value
+
+def fetch_sensor_rows(query_result, batch_size=64):
+    """
+    Read the sensors of a WMI query result as (keywords, sensor_type, value) rows
+    
+    The result set is enumerated batch_size objects per IEnumVARIANT.Next()
+    call instead of one COM round-trip per sensor. Each property is read at
+    most once, and sensors whose name has none of the SENSOR_NAME_RE
+    keywords are dropped before their other properties are read.
+    
+    Falls back to plain per-item iteration if the result set has no
+    enumerator, and never raises: on a COM error part-way through, the rows
+    read so far are returned.
+    """
+    rows = []
+    
+    def add_row(sensor):
+        try:
+            matches = SENSOR_NAME_RE.findall(sensor.Name)
+            if matches:
+                keywords = frozenset(match.lower() for match in matches)
+                rows.append((keywords, sensor.SensorType, sensor.Value))
+        except:
+            pass
+    
+    # pywin32 returns None from _NewEnum() on a com_error
+    try:
+        enum = query_result._NewEnum()
+    except:
+        enum = None
+    
+    if enum is not None:
+        try:
+            while True:
+                batch = enum.Next(batch_size)
+                if not batch:
+                    return rows
+                for sensor in batch:
+                    add_row(sensor)
+        except:
+            if rows:
+                return rows  # Keep what was read; iterating again would duplicate it
+    
+    # Plain per-item iteration
+    try:
+        for sensor in query_result:
+            add_row(sensor)
+    except:
+        pass
+    return rows
+
+def scan_sensors(sensors, predicates, readings):
+    """
+    Fill readings from sensor rows (see fetch_sensor_rows) in a single pass
+    
+    Each sensor is matched against every predicate whose reading is still
+    missing (None), so the first matching sensor wins.
+    """
+    for keywords, sensor_type, value in sensors:
+        pending = [key for key, reading in readings.items() if reading is None]
+        if not pending:
+            break
+        
+        for key in pending:
+            if predicates[key](sensor_type, keywords):
+                try:
+                    readings[key] = int(value)
+                except:
+                    pass
+    
+    return readings
+
+class NvmlLibrary:
+    """Minimal ctypes binding to the NVIDIA Management Library (used when pynvml is missing)"""
+    
+    NVML_SUCCESS = 0
+    NVML_TEMPERATURE_GPU = 0
+    
+    class Utilization(ctypes.Structure):
+        _fields_ = [('gpu', ctypes.c_uint), ('memory', ctypes.c_uint)]
+    
+    def __init__(self, lib):
+        self._lib = lib
+        self._handle = ctypes.c_void_p()
+    
+    @classmethod
+    def load(cls):
+        """Load and initialize NVML for the first GPU, or return None if unavailable"""
+        if os.name == 'nt':
+            program_files = os.environ.get('ProgramFiles', 'C:\\Program Files')
+            candidates = ['nvml.dll', os.path.join(program_files, 'NVIDIA Corporation', 'NVSMI', 'nvml.dll')]
+        else:
+            candidates = ['libnvidia-ml.so.1', 'libnvidia-ml.so']
+        
+        for path in candidates:
+            try:
+                nvml = cls(ctypes.CDLL(path))
+            except OSError:
+                continue
+            if nvml.init():
+                return nvml
+        return None
+    
+    def init(self):
+        """Initialize NVML and cache the handle of the first GPU"""
+        try:
+            if self._lib.nvmlInit_v2() != self.NVML_SUCCESS:
+                return False
+            if self._lib.nvmlDeviceGetHandleByIndex_v2(0, ctypes.byref(self._handle)) != self.NVML_SUCCESS:
+                self._lib.nvmlShutdown()
+                return False
+        except AttributeError:
+            return False
+        return True
+    
+    def temperature(self):
+        """GPU core temperature in °C, or None on error"""
+        temp = ctypes.c_uint()
+        if self._lib.nvmlDeviceGetTemperature(self._handle, self.NVML_TEMPERATURE_GPU, ctypes.byref(temp)) != self.NVML_SUCCESS:
+            return None
+        return int(temp.value)
+    
+    def utilization(self):
+        """GPU utilization in percent, or None on error"""
+        rates = self.Utilization()
+        if self._lib.nvmlDeviceGetUtilizationRates(self._handle, ctypes.byref(rates)) != self.NVML_SUCCESS:
+            return None
+        return int(rates.gpu)
+    
+    def shutdown(self):
+        """Release the NVML library"""
+        self._lib.nvmlShutdown()
+
 class PCHardwareMonitor:
-    def __init__(self, port='COM3', baudrate=9600):
+    def __init__(self, port='COM3', baudrate=115200):
         """
         Initialize the PC Hardware Monitor for Arduino TFT Display
         
@@ -20,6 +199,19 @@ class PCHardwareMonitor:
         self.baudrate = baudrate
         self.serial_connection = None
         self.running = False
+        self.update_interval = 1.0  # Seconds between frames sent to Arduino
+        
+        # Delta encoding: skip frames whose values barely changed, but resend
+        # at least every keepalive_interval seconds
+        self.min_change = 1
+        self.keepalive_interval = 5.0
+        self._last_sent = None
+        self._last_sent_time = 0.0
+        
+        # Console status line: redrawn on change, or every status_interval ticks
+        self.status_interval = 5
+        self._last_printed_stats = None
+        self._status_ticks = 0
         
         # Hardware data
         self.cpu_temp = 0
@@ -29,10 +221,75 @@ class PCHardwareMonitor:
         self.gpu_usage = 0
         self.fps = 60
         
+        # Prime psutil's CPU counters so non-blocking reads measure the last tick
+        psutil.cpu_percent(interval=None)
+        
+        # NVIDIA GPU backend (initialized once, reused every tick)
+        self._nvml_handle = None
+        self._nvml_lib = None
+        self._query_gpu = self._query_gpu_smi
+        self._nvsmi_proc = None
+        self._dmon_gpu = (None, None)
+        self.init_nvml()
+        
+        # WMI connections and sensor lists, reused across getters and ticks
+        self._wmi_connections = {}
+        self._sensor_cache = {}
+        
+        # WMI backends that answered at startup (probed once in probe_wmi_backends)
+        self._sensor_namespaces = ()
+        self._has_thermal_zone = False
+        self._sensor_readings = frozenset()
+        
+        # CPU temperature source, bound once in probe_cpu_temperature()
+        self._read_cpu_temp = self._cpu_temp_simulated
+        
+        # Background collector state (latest stats are shared under the lock)
+        self._collector_thread = None
+        self._stop_event = threading.Event()
+        self._stats_ready = threading.Event()
+        self._stats_lock = threading.Lock()
+        self._latest_stats = None
+        
+        # Worker pool overlapping the GPU query with the WMI/psutil reads
+        # while collecting, with at most one in-flight query per backend
+        self._pool = None
+        self._pending = {}
+        self.fetch_timeout = 2.0
+        
         print("🖥️  PC Hardware Monitor for Arduino TFT Display")
         print("=" * 55)
+        self.probe_wmi_backends()
+        self.probe_cpu_temperature()
         self.detect_available_ports()
         
+    def probe_wmi_backends(self):
+        """Check once which WMI sensor sources exist, so ticks skip missing ones"""
+        if win32com is None:
+            return
+        
+        self._sensor_namespaces = tuple(ns for ns in (OHM_NAMESPACE, LHM_NAMESPACE) if self._get_sensors(ns))
+        self._has_thermal_zone = self._read_thermal_zone() is not None
+        self._sensor_readings = frozenset(key for key, value in self.read_hardware_sensors().items() if value is not None)
+        
+        for namespace in self._sensor_namespaces:
+            print(f"✅ Hardware sensors found in {namespace}")
+        
+        # COM objects belong to the probing thread; the collector opens its own
+        self._wmi_connections.clear()
+        self._sensor_cache.clear()
+    
+    def probe_cpu_temperature(self):
+        """Bind the first CPU temperature source that works, so ticks don't re-check capabilities"""
+        if self._cpu_temp_psutil() is not None:
+            self._read_cpu_temp = self._cpu_temp_psutil
+        elif 'cpu_temp' in self._sensor_readings:
+            self._read_cpu_temp = self._cpu_temp_sensors
+        elif self._has_thermal_zone:
+            self._read_cpu_temp = self._cpu_temp_thermal
+        else:
+            self._read_cpu_temp = self._cpu_temp_simulated
+    
     def detect_available_ports(self):
         """Detect available serial ports"""
         try:
@@ -49,6 +306,80 @@ class PCHardwareMonitor:
         except ImportError:
             print("⚠️  Could not list ports. Please install pyserial: pip install pyserial")
     
+    def init_nvml(self):
+        """Bind the fastest available GPU query: pynvml, NVML via ctypes, then nvidia-smi"""
+        # Method 1: pynvml bindings
+        if pynvml is not None:
+            try:
+                pynvml.nvmlInit()
+                try:
+                    self._nvml_handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+                    self._query_gpu = self._query_gpu_nvml
+                    return True
+                except Exception:
+                    pynvml.nvmlShutdown()
+            except Exception:
+                pass
+        
+        # Method 2: NVML shared library through ctypes
+        self._nvml_lib = NvmlLibrary.load()
+        if self._nvml_lib is not None:
+            self._query_gpu = self._query_gpu_nvml_ctypes
+            return True
+        
+        # Method 3: nvidia-smi subprocess per query
+        self._query_gpu = self._query_gpu_smi
+        return False
+    
+    def shutdown_nvml(self):
+        """Release the NVML library"""
+        try:
+            if self._nvml_handle is not None:
+                pynvml.nvmlShutdown()
+            elif self._nvml_lib is not None:
+                self._nvml_lib.shutdown()
+        except Exception:
+            pass
+        
+        self._nvml_handle = None
+        self._nvml_lib = None
+        self._query_gpu = self._query_gpu_smi
+    
+    def _get_wmi(self, namespace):
+        """Return a cached WMI connection for namespace (None if unavailable)"""
+        if namespace not in self._wmi_connections:
+            try:
+                self._wmi_connections[namespace] = win32com.client.GetObject("winmgmts:" + namespace)
+            except:
+                self._wmi_connections[namespace] = None
+        return self._wmi_connections[namespace]
+    
+    def _get_sensors(self, namespace, ttl=None):
+        """
+        Return the sensors of namespace, re-querying WMI at most every ttl seconds
+        
+        The default ttl is half a tick: getters within one tick share a query,
+        while every tick still gets fresh readings despite scheduling jitter.
+        """
+        if ttl is None:
+            ttl = 0.5 * self.update_interval
+        now = time.monotonic()
+        cached = self._sensor_cache.get(namespace)
+        if cached and now - cached[0] < ttl:
+            return cached[1]
+        
+        sensors = []
+        w = self._get_wmi(namespace)
+        if w is not None:
+            try:
+                sensors = fetch_sensor_rows(w.ExecQuery(SENSOR_QUERY, "WQL", WBEM_FLAGS))
+            except:
+                # Drop the connection so the next query reconnects
+                self._wmi_connections.pop(namespace, None)
+        
+        self._sensor_cache[namespace] = (now, sensors)
+        return sensors
+    
     def connect_serial(self):
         """Establish serial connection to Arduino"""
         try:
@@ -67,168 +398,190 @@ class PCHardwareMonitor:
             print(f"❌ Unexpected error: {e}")
             return False
     
-    def get_cpu_temperature(self):
-        """Get CPU temperature using multiple methods"""
+    def query_gpu(self):
+        """Get NVIDIA GPU (temperature, usage) from the fastest available backend"""
+        gpu = self._query_gpu()
+        
+        # Retry with nvidia-smi if NVML failed; the dmon reader falls back by
+        # itself once nvidia-smi exits, so don't spawn a second process beside it
+        if gpu == (None, None) and self._query_gpu not in (self._query_gpu_smi, self._query_gpu_dmon):
+            gpu = self._query_gpu_smi()
+        return gpu
+    
+    def _query_gpu_nvml(self):
+        """Query the GPU through pynvml"""
         try:
-            # Method 1: Try psutil sensors (Linux/some Windows systems)
-            if hasattr(psutil, "sensors_temperatures"):
-                temps = psutil.sensors_temperatures()
-                if temps:
-                    for name, entries in temps.items():
-                        if any(keyword in name.lower() for keyword in ['cpu', 'core', 'processor']):
-                            if entries:
-                                return max(int(entry.current) for entry in entries if entry.current)
-            
-            # Method 2: Try OpenHardwareMonitor (Windows)
-            try:
-                import wmi
-                w = wmi.WMI(namespace="root\\OpenHardwareMonitor")
-                sensors = w.Sensor()
-                for sensor in sensors:
-                    if sensor.SensorType == 'Temperature' and 'CPU' in sensor.Name:
-                        return int(sensor.Value)
-            except:
-                pass
-            
-            # Method 3: Try LibreHardwareMonitor (Windows)
-            try:
-                import wmi
-                w = wmi.WMI(namespace="root\\LibreHardwareMonitor")
-                sensors = w.Sensor()
-                for sensor in sensors:
-                    if sensor.SensorType == 'Temperature' and 'CPU' in sensor.Name:
-                        return int(sensor.Value)
-            except:
-                pass
-            
-            # Method 4: Try WMI thermal zone (Windows)
-            try:
-                import wmi
-                w = wmi.WMI(namespace="root\\wmi")
-                temperature_info = w.MSAcpi_ThermalZoneTemperature()
-                if temperature_info:
-                    temp_celsius = (temperature_info[0].CurrentTemperature / 10.0) - 273.15
-                    return int(temp_celsius)
-            except:
-                pass
-            
-            # Fallback: Simulate based on CPU usage
-            cpu_load = psutil.cpu_percent(interval=0.1)
-            simulated_temp = 35 + (cpu_load * 0.4)
-            return int(simulated_temp)
-            
-        except Exception as e:
-            # Return safe default
-            return 45
+            temp = pynvml.nvmlDeviceGetTemperature(self._nvml_handle, pynvml.NVML_TEMPERATURE_GPU)
+            usage = pynvml.nvmlDeviceGetUtilizationRates(self._nvml_handle).gpu
+            return int(temp), int(usage)
+        except Exception:
+            return None, None
+    
+    def _query_gpu_nvml_ctypes(self):
+        """Query the GPU through the ctypes NVML binding"""
+        return self._nvml_lib.temperature(), self._nvml_lib.utilization()
+    
+    def _query_gpu_dmon(self):
+        """Return the latest GPU reading from the `nvidia-smi dmon` reader"""
+        return self._dmon_gpu
     
-    def get_gpu_temperature(self):
-        """Get GPU temperature using nvidia-smi and other methods"""
+    def _query_gpu_smi(self):
+        """Query the GPU with one nvidia-smi call for both fields"""
         try:
-            # Method 1: NVIDIA GPU via nvidia-smi
             result = subprocess.run(
-                ['nvidia-smi', '--query-gpu=temperature.gpu', '--format=csv,noheader,nounits'], 
+                ['nvidia-smi', '--query-gpu=temperature.gpu,utilization.gpu', '--format=csv,noheader,nounits'], 
                 capture_output=True, text=True, timeout=5, 
                 creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
             )
             if result.returncode == 0:
-                temp_str = result.stdout.strip()
-                if temp_str and temp_str != '[Not Supported]':
-                    return int(float(temp_str))
+                values = []
+                for field in result.stdout.strip().splitlines()[0].split(','):
+                    try:
+                        values.append(int(float(field)))
+                    except ValueError:
+                        values.append(None)  # e.g. '[Not Supported]'
+                if len(values) == 2:
+                    return values[0], values[1]
         except:
             pass
         
-        # Method 2: Try OpenHardwareMonitor
+        return None, None
+    
+    def read_hardware_sensors(self):
+        """Scan OpenHardwareMonitor/LibreHardwareMonitor sensors once for all readings"""
+        readings = dict.fromkeys(SENSOR_PREDICATES)
+        
+        for namespace in self._sensor_namespaces:
+            scan_sensors(self._get_sensors(namespace), SENSOR_PREDICATES, readings)
+            
+            # Only fall back to LibreHardwareMonitor for readings OHM lacks
+            if None not in readings.values():
+                break
+        
+        return readings
+    
+    def _read_thermal_zone(self):
+        """Read the ACPI thermal zone temperature through WMI, or None"""
         try:
-            import wmi
-            w = wmi.WMI(namespace="root\\OpenHardwareMonitor")
-            sensors = w.Sensor()
-            for sensor in sensors:
-                if sensor.SensorType == 'Temperature' and 'GPU' in sensor.Name:
-                    return int(sensor.Value)
+            w = self._get_wmi(THERMAL_NAMESPACE)
+            temperature_info = list(w.ExecQuery(THERMAL_QUERY, "WQL", WBEM_FLAGS))
+            if temperature_info:
+                temp_celsius = (temperature_info[0].CurrentTemperature / 10.0) - 273.15
+                return int(temp_celsius)
         except:
             pass
-        
-        # Method 3: Try LibreHardwareMonitor
+        return None
+    
+    def _cpu_temp_psutil(self, sensors=None, cpu_usage_hint=None):
+        """CPU temperature from psutil sensors (Linux/some Windows systems)"""
         try:
-            import wmi
-            w = wmi.WMI(namespace="root\\LibreHardwareMonitor")
-            sensors = w.Sensor()
-            for sensor in sensors:
-                if sensor.SensorType == 'Temperature' and 'GPU' in sensor.Name:
-                    return int(sensor.Value)
+            temps = psutil.sensors_temperatures()
         except:
-            pass
+            return None  # Not provided on this platform
+        
+        for name, entries in temps.items():
+            if CPU_SENSOR_NAME_RE.search(name):
+                values = [int(entry.current) for entry in entries if entry.current]
+                if values:
+                    return max(values)
+        return None
+    
+    def _cpu_temp_sensors(self, sensors=None, cpu_usage_hint=None):
+        """CPU temperature from OpenHardwareMonitor/LibreHardwareMonitor (Windows)"""
+        if sensors is None:
+            sensors = self.read_hardware_sensors()
+        return sensors['cpu_temp']
+    
+    def _cpu_temp_thermal(self, sensors=None, cpu_usage_hint=None):
+        """CPU temperature from the WMI thermal zone (Windows)"""
+        return self._read_thermal_zone()
+    
+    def _cpu_temp_simulated(self, sensors=None, cpu_usage_hint=None):
+        """CPU temperature simulated from CPU usage (reuse this tick's sample if given)"""
+        cpu_load = cpu_usage_hint
+        if cpu_load is None:
+            cpu_load = psutil.cpu_percent(interval=None)
+        return int(35 + (cpu_load * 0.4))
+    
+    def get_cpu_temperature(self, sensors=None, cpu_usage_hint=None):
+        """Get CPU temperature from the source picked by probe_cpu_temperature()
+        
+        Args:
+            sensors: Readings from read_hardware_sensors(), queried if needed and not given
+            cpu_usage_hint: CPU usage already sampled this tick, used by the simulation
+        """
+        try:
+            temp = self._read_cpu_temp(sensors, cpu_usage_hint)
+            if temp is None:
+                # Fallback: the source had no reading this tick
+                temp = self._cpu_temp_simulated(sensors, cpu_usage_hint)
+            return temp
+            
+        except Exception as e:
+            # Return safe default
+            return 45
+    
+    def get_gpu_temperature(self, gpu=None, sensors=None):
+        """Get GPU temperature using NVML, nvidia-smi and other methods
+        
+        Args:
+            gpu: (temperature, usage) from query_gpu(), queried if not given
+            sensors: Readings from read_hardware_sensors(), queried if not given
+        """
+        # Method 1: NVIDIA GPU via NVML/nvidia-smi
+        if gpu is None:
+            gpu = self.query_gpu()
+        if gpu[0] is not None:
+            return gpu[0]
+        
+        # Method 2: Try OpenHardwareMonitor/LibreHardwareMonitor
+        if sensors is None:
+            sensors = self.read_hardware_sensors()
+        if sensors['gpu_temp'] is not None:
+            return sensors['gpu_temp']
         
         # Fallback: Return simulated temperature
         return 55
     
-    def get_gpu_usage(self):
-        """Get GPU usage percentage"""
-        try:
-            # Method 1: NVIDIA GPU via nvidia-smi
-            result = subprocess.run(
-                ['nvidia-smi', '--query-gpu=utilization.gpu', '--format=csv,noheader,nounits'], 
-                capture_output=True, text=True, timeout=5,
-                creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
-            )
-            if result.returncode == 0:
-                usage_str = result.stdout.strip()
-                if usage_str and usage_str != '[Not Supported]':
-                    return int(float(usage_str))
-        except:
-            pass
+    def get_gpu_usage(self, gpu=None, sensors=None):
+        """Get GPU usage percentage
         
-        # Method 2: Try OpenHardwareMonitor
-        try:
-            import wmi
-            w = wmi.WMI(namespace="root\\OpenHardwareMonitor")
-            sensors = w.Sensor()
-            for sensor in sensors:
-                if sensor.SensorType == 'Load' and 'GPU' in sensor.Name:
-                    return int(sensor.Value)
-        except:
-            pass
+        Args:
+            gpu: (temperature, usage) from query_gpu(), queried if not given
+            sensors: Readings from read_hardware_sensors(), queried if not given
+        """
+        # Method 1: NVIDIA GPU via NVML/nvidia-smi
+        if gpu is None:
+            gpu = self.query_gpu()
+        if gpu[1] is not None:
+            return gpu[1]
         
-        # Method 3: Try LibreHardwareMonitor
-        try:
-            import wmi
-            w = wmi.WMI(namespace="root\\LibreHardwareMonitor")
-            sensors = w.Sensor()
-            for sensor in sensors:
-                if sensor.SensorType == 'Load' and 'GPU' in sensor.Name:
-                    return int(sensor.Value)
-        except:
-            pass
+        # Method 2: Try OpenHardwareMonitor/LibreHardwareMonitor
+        if sensors is None:
+            sensors = self.read_hardware_sensors()
+        if sensors['gpu_usage'] is not None:
+            return sensors['gpu_usage']
         
         # Fallback: Return simulated usage
         return 35
     
-    def get_fps(self):
-        """Get current FPS - simplified version for Arduino"""
+    def get_fps(self, sensors=None, gpu_usage=None):
+        """Get current FPS - simplified version for Arduino
+        
+        Args:
+            sensors: Readings from read_hardware_sensors(), queried if not given
+            gpu_usage: GPU usage used for the estimate, queried if not given
+        """
         try:
             # Try to get from OpenHardwareMonitor/LibreHardwareMonitor
-            try:
-                import wmi
-                w = wmi.WMI(namespace="root\\OpenHardwareMonitor")
-                sensors = w.Sensor()
-                for sensor in sensors:
-                    if 'fps' in sensor.Name.lower() or 'framerate' in sensor.Name.lower():
-                        return int(sensor.Value)
-            except:
-                pass
-            
-            try:
-                import wmi
-                w = wmi.WMI(namespace="root\\LibreHardwareMonitor")
-                sensors = w.Sensor()
-                for sensor in sensors:
-                    if 'fps' in sensor.Name.lower() or 'framerate' in sensor.Name.lower():
-                        return int(sensor.Value)
-            except:
-                pass
+            if sensors is None:
+                sensors = self.read_hardware_sensors()
+            if sensors['fps'] is not None:
+                return sensors['fps']
             
             # Estimate FPS based on GPU usage (for demo purposes)
-            gpu_usage = self.get_gpu_usage()
+            if gpu_usage is None:
+                gpu_usage = self.get_gpu_usage(sensors=sensors)
             if gpu_usage > 90:
                 return 45 + (gpu_usage - 90) * 2  # 45-65 FPS
             elif gpu_usage > 70:
@@ -241,26 +594,69 @@ class PCHardwareMonitor:
         except Exception as e:
             return 60  # Default fallback
     
+    def _submit(self, fn):
+        """
+        Run fn on the worker pool, or right away when no pool is running
+        
+        Returns None while an earlier call of fn is still running: a hung
+        backend holds one worker instead of queueing a new task every tick,
+        and its late result is never passed off as this tick's reading.
+        """
+        if self._pool is not None:
+            pending = self._pending.get(fn.__name__)
+            if pending is not None and not pending.done():
+                return None
+            
+            future = self._pool.submit(fn)
+            self._pending[fn.__name__] = future
+            return future
+        
+        future = Future()
+        try:
+            future.set_result(fn())
+        except Exception as e:
+            future.set_exception(e)
+        return future
+    
+    def _wait_result(self, future, default):
+        """Return the result of future, or default if there is none, it failed or took longer than fetch_timeout"""
+        if future is None:
+            return default
+        
+        try:
+            return future.result(timeout=self.fetch_timeout)
+        except Exception:
+            return default
+    
     def get_system_stats(self):
         """Collect all system statistics"""
         try:
+            # Query the GPU and the WMI sensors once, shared by all getters.
+            # The GPU query runs on the worker pool; WMI stays on this thread,
+            # which owns the COM apartment and the connections
+            gpu_future = self._submit(self.query_gpu)
+            
             # Get basic stats
-            self.cpu_usage = int(psutil.cpu_percent(interval=0.1))
+            # Non-blocking: usage since the previous call, i.e. over the last tick
+            self.cpu_usage = int(psutil.cpu_percent(interval=None))
             self.ram_usage = int(psutil.virtual_memory().percent)
             
+            sensors = self.read_hardware_sensors()
+            gpu = self._wait_result(gpu_future, (None, None))
+            
             # Get temperatures and GPU stats
-            self.cpu_temp = self.get_cpu_temperature()
-            self.gpu_temp = self.get_gpu_temperature()
-            self.gpu_usage = self.get_gpu_usage()
-            self.fps = self.get_fps()
+            self.cpu_temp = self.get_cpu_temperature(sensors=sensors, cpu_usage_hint=self.cpu_usage)
+            self.gpu_temp = self.get_gpu_temperature(gpu=gpu, sensors=sensors)
+            self.gpu_usage = self.get_gpu_usage(gpu=gpu, sensors=sensors)
+            self.fps = self.get_fps(sensors=sensors, gpu_usage=self.gpu_usage)
             
             # Ensure all values are within valid ranges
-            self.cpu_temp = max(0, min(100, self.cpu_temp))
-            self.gpu_temp = max(0, min(100, self.gpu_temp))
-            self.cpu_usage = max(0, min(100, self.cpu_usage))
-            self.ram_usage = max(0, min(100, self.ram_usage))
-            self.gpu_usage = max(0, min(100, self.gpu_usage))
-            self.fps = max(0, min(999, self.fps))
+            self.cpu_temp = clamp(self.cpu_temp, 0, 100)
+            self.gpu_temp = clamp(self.gpu_temp, 0, 100)
+            self.cpu_usage = clamp(self.cpu_usage, 0, 100)
+            self.ram_usage = clamp(self.ram_usage, 0, 100)
+            self.gpu_usage = clamp(self.gpu_usage, 0, 100)
+            self.fps = clamp(self.fps, 0, 999)
             
             return {
                 'cpu_temp': self.cpu_temp,
@@ -282,21 +678,193 @@ class PCHardwareMonitor:
                 'fps': 60
             }
     
+    def _collector_loop(self):
+        """Collect system statistics in the background, independently of the serial loop"""
+        # WMI is COM based: initialize COM once for this thread and open the
+        # connections here, so every query of the thread reuses them
+        com_initialized = False
+        if pythoncom is not None:
+            try:
+                pythoncom.CoInitializeEx(pythoncom.COINIT_MULTITHREADED)
+                com_initialized = True
+            except Exception:
+                pass
+        
+        for namespace in self._sensor_namespaces:
+            self._get_wmi(namespace)
+        if self._has_thermal_zone:
+            self._get_wmi(THERMAL_NAMESPACE)
+        
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stats-fetch")
+        
+        try:
+            next_tick = time.monotonic()
+            while not self._stop_event.is_set():
+                stats = self.get_system_stats()
+                with self._stats_lock:
+                    self._latest_stats = stats
+                self._stats_ready.set()
+                
+                next_tick = self.wait_for_next_tick(next_tick, wait=self._stop_event.wait)
+        finally:
+            # Let a running GPU query finish before NVML can be shut down
+            pool, self._pool = self._pool, None
+            pool.shutdown(wait=True)
+            self._pending.clear()
+            
+            # COM objects created in this thread must be released before CoUninitialize() is called
+            self._wmi_connections.clear()
+            self._sensor_cache.clear()
+            if com_initialized:
+                pythoncom.CoUninitialize()
+    
+    def wait_for_next_tick(self, next_tick, wait=time.sleep):
+        """
+        Sleep until the tick after next_tick and return its time
+        
+        Ticks are phase-locked to time.monotonic(), so the time spent working
+        between ticks doesn't accumulate as drift. After falling more than a
+        full interval behind, the schedule restarts from now instead of
+        bursting to catch up.
+        """
+        next_tick += self.update_interval
+        delay = next_tick - time.monotonic()
+        if delay > 0:
+            wait(delay)
+        elif delay < -self.update_interval:
+            next_tick = time.monotonic()
+        return next_tick
+    
+    def start_collector(self):
+        """Start the background statistics collector thread"""
+        if self._collector_thread and self._collector_thread.is_alive():
+            return
+        
+        self._stop_event.clear()
+        self._stats_ready.clear()
+        self.start_gpu_monitor()
+        self._collector_thread = threading.Thread(target=self._collector_loop, name="stats-collector", daemon=True)
+        self._collector_thread.start()
+    
+    def stop_collector(self):
+        """Stop the background statistics collector thread"""
+        self._stop_event.set()
+        if self._collector_thread:
+            self._collector_thread.join(timeout=5)
+            self._collector_thread = None
+        self.stop_gpu_monitor()
+    
+    def start_gpu_monitor(self):
+        """Start a persistent `nvidia-smi dmon` reader when NVML is unavailable"""
+        if self._query_gpu != self._query_gpu_smi:
+            return False
+        
+        try:
+            self._nvsmi_proc = subprocess.Popen(
+                ['nvidia-smi', 'dmon', '-s', 'pu', '-d', str(max(1, int(self.update_interval)))],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+                creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+            )
+        except OSError:
+            self._nvsmi_proc = None
+            return False
+        
+        self._dmon_gpu = (None, None)
+        threading.Thread(target=self._dmon_reader_loop, args=(self._nvsmi_proc,), name="nvidia-smi-dmon", daemon=True).start()
+        self._query_gpu = self._query_gpu_dmon
+        return True
+    
+    def stop_gpu_monitor(self):
+        """Stop the `nvidia-smi dmon` reader, if running"""
+        if self._nvsmi_proc is None:
+            return
+        
+        try:
+            self._nvsmi_proc.terminate()
+            self._nvsmi_proc.wait(timeout=5)
+        except Exception:
+            pass
+        
+        self._nvsmi_proc = None
+        self._dmon_gpu = (None, None)
+        self._query_gpu = self._query_gpu_smi
+    
+    def _dmon_reader_loop(self, proc):
+        """Parse `nvidia-smi dmon` lines into the latest (temperature, usage) of GPU 0"""
+        columns = None
+        for line in proc.stdout:
+            if line.startswith('#'):
+                # Header rows: '# gpu pwr gtemp ...' names, then '# Idx W C ...' units
+                names = line[1:].split()
+                if 'gpu' in names:
+                    columns = names
+                continue
+            
+            fields = line.split()
+            if columns is None or len(fields) != len(columns):
+                continue
+            row = dict(zip(columns, fields))
+            if row['gpu'] != '0':
+                continue
+            
+            values = []
+            for key in ('gtemp', 'sm'):
+                try:
+                    values.append(int(row[key]))
+                except (KeyError, ValueError):
+                    values.append(None)  # e.g. '-' when not supported
+            self._dmon_gpu = (values[0], values[1])
+        
+        # nvidia-smi exited; fall back to per-query calls
+        self._dmon_gpu = (None, None)
+        if proc is self._nvsmi_proc:
+            self._query_gpu = self._query_gpu_smi
+    
+    def get_latest_stats(self):
+        """Return the most recent statistics from the collector (None before the first sample)"""
+        with self._stats_lock:
+            return self._latest_stats
+    
     def send_data_to_arduino(self, data):
         """Send formatted data to Arduino"""
         if not self.serial_connection:
             return False
         
         try:
-            # Format for Arduino: CPU_Temp,GPU_Temp,CPU_Usage,RAM_Usage,GPU_Usage,FPS
-            data_string = f"{data['cpu_temp']},{data['gpu_temp']},{data['cpu_usage']},{data['ram_usage']},{data['gpu_usage']},{data['fps']}\n"
-            self.serial_connection.write(data_string.encode())
-            self.serial_connection.flush()
+            values = (data['cpu_temp'], data['gpu_temp'], data['cpu_usage'],
+                      data['ram_usage'], data['gpu_usage'], data['fps'])
+            
+            # Skip unchanged frames; the Arduino keeps showing the last values
+            now = time.monotonic()
+            if self._last_sent is not None and now - self._last_sent_time < self.keepalive_interval:
+                max_delta = max(abs(new - old) for new, old in zip(values, self._last_sent))
+                if max_delta < self.min_change:
+                    return True
+            
+            # Build the frame as bytes directly; a single short frame needs no flush()
+            self.serial_connection.write(FRAME_FMT % values)
+            self._last_sent = values
+            self._last_sent_time = now
             return True
         except Exception as e:
             print(f"❌ Error sending data: {e}")
             return False
     
+    def print_status(self, stats):
+        """Redraw the console status line if stats changed or status_interval ticks passed"""
+        self._status_ticks += 1
+        if stats == self._last_printed_stats and self._status_ticks < self.status_interval:
+            return
+        
+        self._last_printed_stats = stats
+        self._status_ticks = 0
+        
+        timestamp = time.strftime("%H:%M:%S")
+        sys.stdout.write(f"\r[{timestamp}] CPU: {stats['cpu_temp']:2d}°C ({stats['cpu_usage']:2d}%) | "
+                         f"GPU: {stats['gpu_temp']:2d}°C ({stats['gpu_usage']:2d}%) | "
+                         f"RAM: {stats['ram_usage']:2d}% | FPS: {stats['fps']:3d}")
+        sys.stdout.flush()
+    
     def start_monitoring(self):
         """Start the monitoring loop"""
         if not self.connect_serial():
@@ -316,15 +884,20 @@ class PCHardwareMonitor:
         max_consecutive_errors = 5
         
         try:
+            # Collect stats in the background so slow sensors don't delay frames
+            self.start_collector()
+            self._stats_ready.wait(timeout=10)
+            next_tick = time.monotonic()
+            
             while self.running:
-                # Get system stats
-                stats = self.get_system_stats()
+                # Get the most recent system stats
+                stats = self.get_latest_stats()
+                if stats is None:
+                    next_tick = self.wait_for_next_tick(next_tick)
+                    continue
                 
                 # Print to console
-                timestamp = datetime.now().strftime("%H:%M:%S")
-                print(f"\r[{timestamp}] CPU: {stats['cpu_temp']:2d}°C ({stats['cpu_usage']:2d}%) | "
-                      f"GPU: {stats['gpu_temp']:2d}°C ({stats['gpu_usage']:2d}%) | "
-                      f"RAM: {stats['ram_usage']:2d}% | FPS: {stats['fps']:3d}", end="", flush=True)
+                self.print_status(stats)
                 
                 # Send to Arduino
                 if self.send_data_to_arduino(stats):
@@ -335,7 +908,8 @@ class PCHardwareMonitor:
                         print(f"\n❌ Too many consecutive errors ({consecutive_errors}). Stopping...")
                         break
                 
-                time.sleep(1)  # Update every second
+                # Sleep until the next tick boundary (update every second)
+                next_tick = self.wait_for_next_tick(next_tick)
                 
         except KeyboardInterrupt:
             print("\n\n⏹️  Monitoring stopped by user")
@@ -347,12 +921,14 @@ class PCHardwareMonitor:
     def stop_monitoring(self):
         """Stop monitoring and close connections"""
         self.running = False
+        self.stop_collector()
         if self.serial_connection:
             try:
                 self.serial_connection.close()
                 print("🔌 Serial connection closed")
             except:
                 pass
+        self.shutdown_nvml()
         print("👋 PC Hardware Monitor stopped")
 
 def check_dependencies():
@@ -374,13 +950,15 @@ def check_dependencies():
             print(f"❌ {lib} not found")
             missing_libs.append(pip_name)
     
-    # Check optional libraries
-    optional_libs = ['wmi']
-    for lib in optional_libs:
-        try:
-            __import__(lib)
+    # Optional libraries are imported once at module load
+    optional_libs = {
+        'win32com.client': win32com,
+        'pynvml': pynvml
+    }
+    for lib, module in optional_libs.items():
+        if module is not None:
             print(f"✅ {lib} library found (optional)")
-        except ImportError:
+        else:
             print(f"⚠️  {lib} not found (optional - for better temperature readings)")
     
     if missing_libs:
@@ -411,7 +989,7 @@ def main():
             break
         print("❌ Please enter a valid port.")
     
-    baudrate = 9600
+    baudrate = 115200
     print(f"📡 Using baudrate: {baudrate}")
     
     print("\n" + "="*55)